@@ -7,10 +7,39 @@ logging configuration, and system parameters.
 """
 
 import os
-from dataclasses import dataclass, field
-from typing import Optional, Dict, Any
+import threading
+from dataclasses import dataclass, field, fields, replace
+from functools import cached_property
+from typing import Optional, Dict, Any, Callable, FrozenSet, List, Sequence
 from enum import Enum
 import logging
+from logging import Logger
+from logging.handlers import RotatingFileHandler
+
+
+# Snapshot of the process environment, refreshed by reload_config()
+_ENV: Dict[str, str] = dict(os.environ)
+
+# Accepted spellings for boolean environment variables
+_TRUTHY = frozenset({"1", "true", "yes", "on", "t", "y"})
+
+
+def _get(name: str, default: Any = None, cast: Callable[[str], Any] = str) -> Any:
+    """Read a variable from the environment snapshot, casting it if present."""
+    value = _ENV.get(name)
+    return cast(value) if value is not None else default
+
+
+def _get_int(name: str, default: int) -> int:
+    """Read an integer variable from the environment snapshot."""
+    value = _ENV.get(name)
+    return int(value) if value is not None else default
+
+
+def _get_bool(name: str, default: bool) -> bool:
+    """Read a boolean variable from the environment snapshot."""
+    value = _ENV.get(name)
+    return value.strip().lower() in _TRUTHY if value is not None else default
 
 
 class Environment(Enum):
@@ -20,22 +49,25 @@ class Environment(Enum):
     PRODUCTION = "production"
 
 
+_ENVIRONMENT_BY_NAME: Dict[str, Environment] = {e.value: e for e in Environment}
+
+
 @dataclass
 class DatabaseConfig:
     """Database configuration settings."""
     
-    host: str = field(default_factory=lambda: os.getenv("DB_HOST", "localhost"))
-    port: int = field(default_factory=lambda: int(os.getenv("DB_PORT", 5432)))
-    username: str = field(default_factory=lambda: os.getenv("DB_USER", "postgres"))
-    password: str = field(default_factory=lambda: os.getenv("DB_PASSWORD", ""))
-    database: str = field(default_factory=lambda: os.getenv("DB_NAME", "polymer_kg"))
-    pool_size: int = field(default_factory=lambda: int(os.getenv("DB_POOL_SIZE", 10)))
-    max_overflow: int = field(default_factory=lambda: int(os.getenv("DB_MAX_OVERFLOW", 20)))
-    echo: bool = field(default_factory=lambda: os.getenv("DB_ECHO", "false").lower() == "true")
+    host: str = field(default_factory=lambda: _get("DB_HOST", "localhost"))
+    port: int = field(default_factory=lambda: _get_int("DB_PORT", 5432))
+    username: str = field(default_factory=lambda: _get("DB_USER", "postgres"))
+    password: str = field(default_factory=lambda: _get("DB_PASSWORD", ""))
+    database: str = field(default_factory=lambda: _get("DB_NAME", "polymer_kg"))
+    pool_size: int = field(default_factory=lambda: _get_int("DB_POOL_SIZE", 10))
+    max_overflow: int = field(default_factory=lambda: _get_int("DB_MAX_OVERFLOW", 20))
+    echo: bool = field(default_factory=lambda: _get_bool("DB_ECHO", False))
     
-    @property
+    @cached_property
     def connection_string(self) -> str:
-        """Generate database connection string."""
+        """Generate database connection string (built once per instance)."""
         return (
             f"postgresql://{self.username}:{self.password}@"
             f"{self.host}:{self.port}/{self.database}"
@@ -46,18 +78,18 @@ class DatabaseConfig:
 class GraphConfig:
     """Knowledge graph configuration settings."""
     
-    backend: str = field(default_factory=lambda: os.getenv("GRAPH_BACKEND", "neo4j"))
-    host: str = field(default_factory=lambda: os.getenv("GRAPH_HOST", "localhost"))
-    port: int = field(default_factory=lambda: int(os.getenv("GRAPH_PORT", 7687)))
-    username: str = field(default_factory=lambda: os.getenv("GRAPH_USER", "neo4j"))
-    password: str = field(default_factory=lambda: os.getenv("GRAPH_PASSWORD", ""))
-    database: str = field(default_factory=lambda: os.getenv("GRAPH_DATABASE", "polymer"))
-    encrypted: bool = field(default_factory=lambda: os.getenv("GRAPH_ENCRYPTED", "false").lower() == "true")
-    trust_cert: str = field(default_factory=lambda: os.getenv("GRAPH_TRUST_CERT", "TRUST_ALL_CERTIFICATES"))
+    backend: str = field(default_factory=lambda: _get("GRAPH_BACKEND", "neo4j"))
+    host: str = field(default_factory=lambda: _get("GRAPH_HOST", "localhost"))
+    port: int = field(default_factory=lambda: _get_int("GRAPH_PORT", 7687))
+    username: str = field(default_factory=lambda: _get("GRAPH_USER", "neo4j"))
+    password: str = field(default_factory=lambda: _get("GRAPH_PASSWORD", ""))
+    database: str = field(default_factory=lambda: _get("GRAPH_DATABASE", "polymer"))
+    encrypted: bool = field(default_factory=lambda: _get_bool("GRAPH_ENCRYPTED", False))
+    trust_cert: str = field(default_factory=lambda: _get("GRAPH_TRUST_CERT", "TRUST_ALL_CERTIFICATES"))
     
-    @property
+    @cached_property
     def connection_uri(self) -> str:
-        """Generate graph database connection URI."""
+        """Generate graph database connection URI (built once per instance)."""
         protocol = "neo4j+s" if self.encrypted else "neo4j"
         return f"{protocol}://{self.host}:{self.port}"
 
@@ -66,74 +98,123 @@ class GraphConfig:
 class APIConfig:
     """API configuration settings."""
     
-    host: str = field(default_factory=lambda: os.getenv("API_HOST", "0.0.0.0"))
-    port: int = field(default_factory=lambda: int(os.getenv("API_PORT", 8000)))
-    debug: bool = field(default_factory=lambda: os.getenv("API_DEBUG", "false").lower() == "true")
-    workers: int = field(default_factory=lambda: int(os.getenv("API_WORKERS", 4)))
-    timeout: int = field(default_factory=lambda: int(os.getenv("API_TIMEOUT", 30)))
-    max_connections: int = field(default_factory=lambda: int(os.getenv("API_MAX_CONNECTIONS", 100)))
-    cors_origins: list = field(default_factory=lambda: os.getenv("CORS_ORIGINS", "*").split(","))
+    host: str = field(default_factory=lambda: _get("API_HOST", "0.0.0.0"))
+    port: int = field(default_factory=lambda: _get_int("API_PORT", 8000))
+    debug: bool = field(default_factory=lambda: _get_bool("API_DEBUG", False))
+    workers: int = field(default_factory=lambda: _get_int("API_WORKERS", 4))
+    timeout: int = field(default_factory=lambda: _get_int("API_TIMEOUT", 30))
+    max_connections: int = field(default_factory=lambda: _get_int("API_MAX_CONNECTIONS", 100))
+    cors_origins: list = field(default_factory=lambda: _get("CORS_ORIGINS", "*").split(","))
 
 
 @dataclass
 class LoggingConfig:
     """Logging configuration settings."""
     
-    level: str = field(default_factory=lambda: os.getenv("LOG_LEVEL", "INFO"))
+    level: str = field(default_factory=lambda: _get("LOG_LEVEL", "INFO"))
     format: str = field(
-        default_factory=lambda: os.getenv(
+        default_factory=lambda: _get(
             "LOG_FORMAT",
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
     )
-    output_file: str = field(default_factory=lambda: os.getenv("LOG_FILE", "logs/polymer_kg.log"))
-    max_file_size: int = field(default_factory=lambda: int(os.getenv("LOG_MAX_SIZE", 10485760)))  # 10MB
-    backup_count: int = field(default_factory=lambda: int(os.getenv("LOG_BACKUP_COUNT", 5)))
-    console_output: bool = field(default_factory=lambda: os.getenv("LOG_CONSOLE", "true").lower() == "true")
+    output_file: str = field(default_factory=lambda: _get("LOG_FILE", "logs/polymer_kg.log"))
+    max_file_size: int = field(default_factory=lambda: _get_int("LOG_MAX_SIZE", 10485760))  # 10MB
+    backup_count: int = field(default_factory=lambda: _get_int("LOG_BACKUP_COUNT", 5))
+    console_output: bool = field(default_factory=lambda: _get_bool("LOG_CONSOLE", True))
+    formatter: logging.Formatter = field(init=False, repr=False, compare=False)
+    level_no: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        """Resolve the log level and build the shared formatter once."""
+        level_no = logging.getLevelName(self.level.upper())
+        if not isinstance(level_no, int):
+            # getLevelName maps unknown names to the string "Level <name>"
+            raise ValueError(f"Invalid log level: {self.level!r}")
+        self.formatter = logging.Formatter(self.format)
+        self.level_no = level_no
 
 
 @dataclass
 class CacheConfig:
     """Cache configuration settings."""
     
-    enabled: bool = field(default_factory=lambda: os.getenv("CACHE_ENABLED", "true").lower() == "true")
-    backend: str = field(default_factory=lambda: os.getenv("CACHE_BACKEND", "redis"))
-    host: str = field(default_factory=lambda: os.getenv("CACHE_HOST", "localhost"))
-    port: int = field(default_factory=lambda: int(os.getenv("CACHE_PORT", 6379)))
-    database: int = field(default_factory=lambda: int(os.getenv("CACHE_DB", 0)))
-    ttl: int = field(default_factory=lambda: int(os.getenv("CACHE_TTL", 3600)))  # 1 hour
-    max_size: int = field(default_factory=lambda: int(os.getenv("CACHE_MAX_SIZE", 1000)))
+    enabled: bool = field(default_factory=lambda: _get_bool("CACHE_ENABLED", True))
+    backend: str = field(default_factory=lambda: _get("CACHE_BACKEND", "redis"))
+    host: str = field(default_factory=lambda: _get("CACHE_HOST", "localhost"))
+    port: int = field(default_factory=lambda: _get_int("CACHE_PORT", 6379))
+    database: int = field(default_factory=lambda: _get_int("CACHE_DB", 0))
+    ttl: int = field(default_factory=lambda: _get_int("CACHE_TTL", 3600))  # 1 hour
+    max_size: int = field(default_factory=lambda: _get_int("CACHE_MAX_SIZE", 1000))
+
+
+_SUPPORTED_POLYMER_PROPERTIES: FrozenSet[str] = frozenset({
+    "name", "molecular_formula", "molecular_weight", "glass_transition_temperature",
+    "melting_point", "density", "elasticity", "thermal_conductivity",
+    "electrical_conductivity", "tensile_strength", "elongation_at_break"
+})
 
 
 @dataclass
 class PolymersConfig:
     """Polymer-specific configuration settings."""
     
-    default_language: str = field(default_factory=lambda: os.getenv("POLYMER_LANGUAGE", "en"))
-    max_description_length: int = field(default_factory=lambda: int(os.getenv("POLYMER_MAX_DESC", 5000)))
-    enable_validation: bool = field(default_factory=lambda: os.getenv("POLYMER_VALIDATION", "true").lower() == "true")
-    supported_properties: list = field(
-        default_factory=lambda: [
-            "name", "molecular_formula", "molecular_weight", "glass_transition_temperature",
-            "melting_point", "density", "elasticity", "thermal_conductivity",
-            "electrical_conductivity", "tensile_strength", "elongation_at_break"
-        ]
+    default_language: str = field(default_factory=lambda: _get("POLYMER_LANGUAGE", "en"))
+    max_description_length: int = field(default_factory=lambda: _get_int("POLYMER_MAX_DESC", 5000))
+    enable_validation: bool = field(default_factory=lambda: _get_bool("POLYMER_VALIDATION", True))
+    supported_properties: FrozenSet[str] = field(
+        default_factory=lambda: _SUPPORTED_POLYMER_PROPERTIES
     )
-    batch_import_size: int = field(default_factory=lambda: int(os.getenv("POLYMER_BATCH_SIZE", 500)))
+    batch_import_size: int = field(default_factory=lambda: _get_int("POLYMER_BATCH_SIZE", 500))
 
 
 @dataclass
 class SecurityConfig:
     """Security configuration settings."""
     
-    secret_key: str = field(default_factory=lambda: os.getenv("SECRET_KEY", "dev-secret-key"))
-    algorithm: str = field(default_factory=lambda: os.getenv("JWT_ALGORITHM", "HS256"))
-    token_expiration_hours: int = field(default_factory=lambda: int(os.getenv("TOKEN_EXPIRATION", 24)))
-    enable_api_key_auth: bool = field(default_factory=lambda: os.getenv("ENABLE_API_KEY", "true").lower() == "true")
-    enable_jwt_auth: bool = field(default_factory=lambda: os.getenv("ENABLE_JWT", "true").lower() == "true")
-    rate_limit_enabled: bool = field(default_factory=lambda: os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true")
-    rate_limit_requests: int = field(default_factory=lambda: int(os.getenv("RATE_LIMIT_REQUESTS", 100)))
-    rate_limit_period_seconds: int = field(default_factory=lambda: int(os.getenv("RATE_LIMIT_PERIOD", 60)))
+    secret_key: str = field(default_factory=lambda: _get("SECRET_KEY", "dev-secret-key"))
+    algorithm: str = field(default_factory=lambda: _get("JWT_ALGORITHM", "HS256"))
+    token_expiration_hours: int = field(default_factory=lambda: _get_int("TOKEN_EXPIRATION", 24))
+    enable_api_key_auth: bool = field(default_factory=lambda: _get_bool("ENABLE_API_KEY", True))
+    enable_jwt_auth: bool = field(default_factory=lambda: _get_bool("ENABLE_JWT", True))
+    rate_limit_enabled: bool = field(default_factory=lambda: _get_bool("RATE_LIMIT_ENABLED", True))
+    rate_limit_requests: int = field(default_factory=lambda: _get_int("RATE_LIMIT_REQUESTS", 100))
+    rate_limit_period_seconds: int = field(default_factory=lambda: _get_int("RATE_LIMIT_PERIOD", 60))
+
+
+# Config attributes that may be overridden from configuration files
+_FILE_SECTIONS = ("database", "graph", "api", "logging", "cache", "polymers", "security")
+
+# Secrets are only ever taken from the environment, never from files
+_SECRET_FIELDS = frozenset({"password", "secret_key"})
+
+
+def _coerce_override(current: Any, value: Any) -> Any:
+    """Cast a configuration file value to the type of the field it replaces."""
+    if value is None:
+        raise ValueError("value is empty")
+    if isinstance(current, bool):
+        if isinstance(value, str):
+            return value.strip().lower() in _TRUTHY
+        if isinstance(value, (bool, int)):
+            return bool(value)
+        raise ValueError(f"expected a boolean, got {value!r}")
+    if isinstance(current, int):
+        if isinstance(value, bool) or isinstance(value, float) and not value.is_integer():
+            raise ValueError(f"expected an integer, got {value!r}")
+        return int(value)
+    if isinstance(current, float):
+        return float(value)
+    if isinstance(current, (list, frozenset)):
+        items = value.split(",") if isinstance(value, str) else value
+        if not isinstance(items, (list, tuple, set, frozenset)):
+            raise ValueError(f"expected a list, got {value!r}")
+        return type(current)(items)
+    if isinstance(current, str):
+        if isinstance(value, (dict, list)):
+            raise ValueError(f"expected a string, got {value!r}")
+        return str(value)
+    return value
 
 
 class Config:
@@ -141,37 +222,26 @@ class Config:
     
     # Environment
     environment: Environment = Environment.DEVELOPMENT
-    debug: bool = os.getenv("DEBUG", "false").lower() == "true"
+    debug: bool = _get_bool("DEBUG", False)
     
-    # Sub-configurations
-    database: DatabaseConfig = DatabaseConfig()
-    graph: GraphConfig = GraphConfig()
-    api: APIConfig = APIConfig()
-    logging: LoggingConfig = LoggingConfig()
-    cache: CacheConfig = CacheConfig()
-    polymers: PolymersConfig = PolymersConfig()
-    security: SecurityConfig = SecurityConfig()
+    # Sub-configurations (built per instance in __init__)
+    database: DatabaseConfig
+    graph: GraphConfig
+    api: APIConfig
+    logging: LoggingConfig
+    cache: CacheConfig
+    polymers: PolymersConfig
+    security: SecurityConfig
     
     # Application metadata
     app_name: str = "Polymer Knowledge Graph"
-    app_version: str = os.getenv("APP_VERSION", "1.0.0")
+    app_version: str = _get("APP_VERSION", "1.0.0")
     app_description: str = "A comprehensive knowledge graph system for polymer materials and properties"
     
     def __init__(self):
         """Initialize configuration from environment variables."""
         self._load_environment()
-        self._validate_config()
-    
-    def _load_environment(self) -> None:
-        """Load environment-specific configuration."""
-        env_str = os.getenv("ENVIRONMENT", "development").lower()
-        try:
-            self.environment = Environment(env_str)
-        except ValueError:
-            self.environment = Environment.DEVELOPMENT
-            logging.warning(f"Invalid environment '{env_str}', defaulting to development")
         
-        # Re-initialize configs with environment
         self.database = DatabaseConfig()
         self.graph = GraphConfig()
         self.api = APIConfig()
@@ -179,6 +249,19 @@ class Config:
         self.cache = CacheConfig()
         self.polymers = PolymersConfig()
         self.security = SecurityConfig()
+        self.config_files: List[str] = []
+        
+        self._validate_config()
+    
+    def _load_environment(self) -> None:
+        """Load environment-specific configuration."""
+        env_str = _get("ENVIRONMENT", "development").lower()
+        environment = _ENVIRONMENT_BY_NAME.get(env_str)
+        if environment is not None:
+            self.environment = environment
+        else:
+            self.environment = Environment.DEVELOPMENT
+            logging.warning(f"Invalid environment '{env_str}', defaulting to development")
     
     def _validate_config(self) -> None:
         """Validate critical configuration values."""
@@ -199,6 +282,125 @@ class Config:
         if errors:
             raise ValueError(f"Configuration validation failed: {'; '.join(errors)}")
     
+    def load_file(self, path: str) -> None:
+        """
+        Merge a YAML configuration file into the sub-configurations.
+        
+        Top-level keys name a section (``database``, ``api``, ...) and map to
+        field overrides. Unknown sections/keys are skipped with a warning, and
+        secrets (passwords, secret key) are always left to the environment.
+        The merged configuration is validated before it replaces the current
+        one, so a bad file leaves this instance unchanged.
+        
+        Args:
+            path: Path to the YAML file.
+        
+        Raises:
+            ImportError: If PyYAML is not installed.
+            ValueError: If the file is not a mapping, has a value that cannot be
+                converted to its field's type, or fails validation.
+        """
+        try:
+            import yaml
+        except ImportError as e:
+            raise ImportError(
+                "Loading configuration files requires PyYAML (pip install pyyaml)."
+            ) from e
+        
+        with open(path, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f) or {}
+        if not isinstance(data, dict):
+            raise ValueError(f"Configuration file {path} must contain a mapping")
+        
+        previous = {section: getattr(self, section) for section in _FILE_SECTIONS}
+        try:
+            for section, values in data.items():
+                if section not in _FILE_SECTIONS:
+                    logging.warning(f"Ignoring unknown configuration section '{section}' in {path}")
+                    continue
+                if values is None:
+                    # Empty section (e.g. "database:" with no keys)
+                    continue
+                if not isinstance(values, dict):
+                    logging.warning(
+                        f"Ignoring configuration section '{section}' in {path}; expected a mapping"
+                    )
+                    continue
+                
+                current = getattr(self, section)
+                known = {f.name for f in fields(current) if f.init}
+                overrides = {}
+                for key, value in values.items():
+                    if key not in known:
+                        logging.warning(f"Ignoring unknown key '{section}.{key}' in {path}")
+                    elif key in _SECRET_FIELDS:
+                        logging.warning(
+                            f"Ignoring secret '{section}.{key}' in {path}; set it via environment"
+                        )
+                    else:
+                        try:
+                            overrides[key] = _coerce_override(getattr(current, key), value)
+                        except (TypeError, ValueError) as e:
+                            raise ValueError(
+                                f"Invalid value for '{section}.{key}' in {path}: {e}"
+                            ) from e
+                # replace() builds a fresh instance, so cached/derived values are recomputed
+                setattr(self, section, replace(current, **overrides))
+            
+            self._validate_config()
+        except Exception:
+            for section, value in previous.items():
+                setattr(self, section, value)
+            raise
+        self.config_files.append(path)
+    
+    def watch(self, paths: Sequence[str], interval: float = 5.0) -> threading.Event:
+        """
+        Hot-reload the global configuration when any of ``paths`` changes.
+        
+        A daemon thread polls the files' modification times every ``interval``
+        seconds and calls ``reload_config(paths)`` on change. A reload that
+        fails to load or validate is logged and the current configuration is
+        kept.
+        
+        Args:
+            paths: Configuration files to watch, in merge order.
+            interval: Polling interval in seconds.
+        
+        Returns:
+            threading.Event: Set it to stop watching.
+        """
+        paths = list(paths)
+        stop = threading.Event()
+        
+        def _mtimes() -> List[Optional[int]]:
+            result: List[Optional[int]] = []
+            for path in paths:
+                try:
+                    result.append(os.stat(path).st_mtime_ns)
+                except OSError:
+                    result.append(None)
+            return result
+        
+        # Taken before the thread starts, so a change made right after
+        # watch() returns is not folded into the baseline
+        last = _mtimes()
+        
+        def _poll() -> None:
+            nonlocal last
+            while not stop.wait(interval):
+                current = _mtimes()
+                if current == last:
+                    continue
+                last = current
+                try:
+                    reload_config(paths)
+                except Exception:
+                    logging.exception("Configuration reload failed; keeping current configuration")
+        
+        threading.Thread(target=_poll, name="config-watcher", daemon=True).start()
+        return stop
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary (excluding sensitive data)."""
         return {
@@ -223,12 +425,16 @@ class Config:
             },
         }
     
-    def get_logger(self, name: str) -> logging.Logger:
+    def get_logger(self, name: str) -> Logger:
         """Get a configured logger instance."""
         logger = logging.getLogger(name)
-        logger.setLevel(getattr(logging, self.logging.level))
+        # Loggers are process-wide singletons; configure each one only once
+        if logger.handlers:
+            return logger
+        
+        logger.setLevel(self.logging.level_no)
         
-        formatter = logging.Formatter(self.logging.format)
+        formatter = self.logging.formatter
         
         # Console handler
         if self.logging.console_output:
@@ -238,7 +444,6 @@ class Config:
         
         # File handler
         os.makedirs(os.path.dirname(self.logging.output_file), exist_ok=True)
-        from logging.handlers import RotatingFileHandler
         file_handler = RotatingFileHandler(
             self.logging.output_file,
             maxBytes=self.logging.max_file_size,
@@ -252,18 +457,39 @@ class Config:
 
 # Global configuration instance
 _config: Optional[Config] = None
+_config_lock = threading.Lock()
 
 
 def get_config() -> Config:
     """Get or create the global configuration instance."""
     global _config
+    # Double-checked: only the first calls pay for the lock, and concurrent
+    # first calls still share one instance.
     if _config is None:
-        _config = Config()
+        with _config_lock:
+            if _config is None:
+                _config = Config()
     return _config
 
 
-def reload_config() -> Config:
-    """Reload configuration from environment variables."""
-    global _config
-    _config = Config()
-    return _config
+def reload_config(config_files: Optional[Sequence[str]] = None) -> Config:
+    """
+    Reload configuration from environment variables and configuration files.
+    
+    The new configuration is fully built and validated before it replaces the
+    global instance, so a failed reload leaves the current one in place.
+    
+    Args:
+        config_files: YAML files to merge, in order. Defaults to the files the
+            current configuration was loaded from.
+    """
+    global _config, _ENV
+    with _config_lock:
+        if config_files is None:
+            config_files = _config.config_files if _config is not None else []
+        _ENV = dict(os.environ)
+        new_config = Config()
+        for path in config_files:
+            new_config.load_file(path)
+        _config = new_config
+    return new_config
@@ -5,10 +5,18 @@ This module provides core data structures and abstract base classes for PDF text
 table, and image extraction capabilities.
 """
 
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, cast
 from enum import Enum
+from itertools import chain
+
+import numpy as np
+
+
+# Slotted dataclasses drop the per-instance __dict__; supported on Python 3.10+
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class ElementType(Enum):
@@ -20,7 +28,7 @@ class ElementType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PDFMetadata:
     """Metadata information extracted from a PDF document."""
     
@@ -51,16 +59,19 @@ class PDFMetadata:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TextElement:
-    """Represents a text element in a PDF."""
+    """
+    Represents a text element in a PDF.
+    
+    Extractors should pass ``element_type`` as an ``ElementType`` member, not
+    its string value. Font names are interned, so the few distinct fonts in a
+    document share one string object each.
+    """
     
     text: str
     page_num: int
-    x0: float
-    y0: float
-    x1: float
-    y1: float
+    bbox: Tuple[float, float, float, float]
     font_name: Optional[str] = None
     font_size: Optional[float] = None
     is_bold: bool = False
@@ -68,21 +79,35 @@ class TextElement:
     confidence: float = 1.0
     element_type: ElementType = ElementType.TEXT
     metadata: Dict[str, Any] = field(default_factory=dict)
+    width: float = field(init=False)
+    height: float = field(init=False)
+    
+    def __post_init__(self) -> None:
+        """Precompute element width and height and intern the font name."""
+        self.width = self.bbox[2] - self.bbox[0]
+        self.height = self.bbox[3] - self.bbox[1]
+        if self.font_name is not None:
+            self.font_name = sys.intern(self.font_name)
+    
+    @property
+    def x0(self) -> float:
+        """Get left coordinate."""
+        return self.bbox[0]
     
     @property
-    def bbox(self) -> Tuple[float, float, float, float]:
-        """Get bounding box as tuple (x0, y0, x1, y1)."""
-        return (self.x0, self.y0, self.x1, self.y1)
+    def y0(self) -> float:
+        """Get top coordinate."""
+        return self.bbox[1]
     
     @property
-    def width(self) -> float:
-        """Get element width."""
-        return self.x1 - self.x0
+    def x1(self) -> float:
+        """Get right coordinate."""
+        return self.bbox[2]
     
     @property
-    def height(self) -> float:
-        """Get element height."""
-        return self.y1 - self.y0
+    def y1(self) -> float:
+        """Get bottom coordinate."""
+        return self.bbox[3]
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert text element to dictionary."""
@@ -102,43 +127,211 @@ class TextElement:
         }
 
 
-@dataclass
+# Per-element columns of TextElementBatch besides ``texts``
+_BATCH_ARRAY_COLUMNS = (
+    "page_num", "x0", "y0", "x1", "y1", "font_size", "is_bold", "is_italic", "confidence",
+)
+_BATCH_LIST_COLUMNS = ("font_names", "metadata")
+
+
+@dataclass(eq=False, **_SLOTS)
+class TextElementBatch:
+    """
+    Columnar (structure-of-arrays) storage for a run of text elements.
+    
+    Every column must hold one entry per element of ``texts``. Equality
+    compares the array columns with ``np.array_equal``, treating missing
+    (NaN) font sizes as equal.
+    """
+    
+    texts: List[str] = field(default_factory=list)
+    page_num: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))
+    x0: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    y0: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    x1: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    y1: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    font_size: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    is_bold: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=bool))
+    is_italic: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=bool))
+    confidence: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+    font_names: List[Optional[str]] = field(default_factory=list)
+    metadata: List[Dict[str, Any]] = field(default_factory=list)
+    
+    def __post_init__(self) -> None:
+        """Check that every column has one entry per text."""
+        n = len(self.texts)
+        for name in _BATCH_ARRAY_COLUMNS + _BATCH_LIST_COLUMNS:
+            if len(getattr(self, name)) != n:
+                raise ValueError(
+                    f"TextElementBatch column '{name}' has {len(getattr(self, name))} "
+                    f"entries, expected {n}"
+                )
+    
+    def __eq__(self, other: object) -> bool:
+        """Compare batches column by column."""
+        if not isinstance(other, TextElementBatch):
+            return NotImplemented
+        return (
+            self.texts == other.texts
+            and self.font_names == other.font_names
+            and self.metadata == other.metadata
+            and all(
+                np.array_equal(getattr(self, name), getattr(other, name), equal_nan=True)
+                for name in _BATCH_ARRAY_COLUMNS
+            )
+        )
+    
+    def __len__(self) -> int:
+        """Get number of text elements in the batch."""
+        return len(self.texts)
+    
+    @property
+    def widths(self) -> np.ndarray:
+        """Get element widths."""
+        return cast(np.ndarray, self.x1 - self.x0)
+    
+    @property
+    def heights(self) -> np.ndarray:
+        """Get element heights."""
+        return cast(np.ndarray, self.y1 - self.y0)
+    
+    @classmethod
+    def from_elements(cls, elements: Sequence[TextElement]) -> "TextElementBatch":
+        """
+        Build a batch from a sequence of text elements.
+        
+        Args:
+            elements: Text elements to convert.
+        
+        Returns:
+            TextElementBatch: Columnar copy of the elements. Missing font sizes
+            are stored as NaN.
+        """
+        n = len(elements)
+        return cls(
+            texts=[e.text for e in elements],
+            page_num=np.fromiter((e.page_num for e in elements), dtype=np.int32, count=n),
+            x0=np.fromiter((e.x0 for e in elements), dtype=np.float64, count=n),
+            y0=np.fromiter((e.y0 for e in elements), dtype=np.float64, count=n),
+            x1=np.fromiter((e.x1 for e in elements), dtype=np.float64, count=n),
+            y1=np.fromiter((e.y1 for e in elements), dtype=np.float64, count=n),
+            font_size=np.fromiter(
+                (np.nan if e.font_size is None else e.font_size for e in elements),
+                dtype=np.float64,
+                count=n,
+            ),
+            is_bold=np.fromiter((e.is_bold for e in elements), dtype=bool, count=n),
+            is_italic=np.fromiter((e.is_italic for e in elements), dtype=bool, count=n),
+            confidence=np.fromiter((e.confidence for e in elements), dtype=np.float64, count=n),
+            font_names=[e.font_name for e in elements],
+            metadata=[e.metadata for e in elements],
+        )
+    
+    @classmethod
+    def concatenate(cls, batches: Sequence["TextElementBatch"]) -> "TextElementBatch":
+        """
+        Concatenate several batches into one.
+        
+        Args:
+            batches: Batches to concatenate, in order.
+        
+        Returns:
+            TextElementBatch: A new batch holding all elements.
+        """
+        if not batches:
+            return cls()
+        return cls(
+            texts=[t for b in batches for t in b.texts],
+            page_num=np.concatenate([b.page_num for b in batches]),
+            x0=np.concatenate([b.x0 for b in batches]),
+            y0=np.concatenate([b.y0 for b in batches]),
+            x1=np.concatenate([b.x1 for b in batches]),
+            y1=np.concatenate([b.y1 for b in batches]),
+            font_size=np.concatenate([b.font_size for b in batches]),
+            is_bold=np.concatenate([b.is_bold for b in batches]),
+            is_italic=np.concatenate([b.is_italic for b in batches]),
+            confidence=np.concatenate([b.confidence for b in batches]),
+            font_names=[f for b in batches for f in b.font_names],
+            metadata=[m for b in batches for m in b.metadata],
+        )
+    
+    def get_row(self, index: int) -> TextElement:
+        """Get a single element of the batch as a TextElement."""
+        font_size = float(self.font_size[index])
+        return TextElement(
+            text=self.texts[index],
+            page_num=int(self.page_num[index]),
+            bbox=(
+                float(self.x0[index]),
+                float(self.y0[index]),
+                float(self.x1[index]),
+                float(self.y1[index]),
+            ),
+            font_name=self.font_names[index],
+            font_size=None if np.isnan(font_size) else font_size,
+            is_bold=bool(self.is_bold[index]),
+            is_italic=bool(self.is_italic[index]),
+            confidence=float(self.confidence[index]),
+            metadata=self.metadata[index],
+        )
+    
+    def iter_rows(self) -> Iterator[TextElement]:
+        """Iterate over the batch as TextElement objects."""
+        for index in range(len(self)):
+            yield self.get_row(index)
+
+
+@dataclass(**_SLOTS)
 class TableElement:
     """Represents a table element in a PDF."""
     
     page_num: int
-    x0: float
-    y0: float
-    x1: float
-    y1: float
+    bbox: Tuple[float, float, float, float]
     rows: List[List[str]] = field(default_factory=list)
-    num_rows: int = 0
-    num_cols: int = 0
+    num_rows: int = field(init=False)
+    num_cols: int = field(init=False)
     confidence: float = 1.0
     cell_bboxes: List[List[Tuple[float, float, float, float]]] = field(default_factory=list)
     element_type: ElementType = ElementType.TABLE
     metadata: Dict[str, Any] = field(default_factory=dict)
+    width: float = field(init=False)
+    height: float = field(init=False)
+    
+    def __post_init__(self) -> None:
+        """Precompute table size and derive row/column counts from rows."""
+        self.width = self.bbox[2] - self.bbox[0]
+        self.height = self.bbox[3] - self.bbox[1]
+        self.num_rows = len(self.rows)
+        self.num_cols = max((len(row) for row in self.rows), default=0)
     
     @property
-    def bbox(self) -> Tuple[float, float, float, float]:
-        """Get bounding box as tuple (x0, y0, x1, y1)."""
-        return (self.x0, self.y0, self.x1, self.y1)
+    def x0(self) -> float:
+        """Get left coordinate."""
+        return self.bbox[0]
     
     @property
-    def width(self) -> float:
-        """Get table width."""
-        return self.x1 - self.x0
+    def y0(self) -> float:
+        """Get top coordinate."""
+        return self.bbox[1]
     
     @property
-    def height(self) -> float:
-        """Get table height."""
-        return self.y1 - self.y0
+    def x1(self) -> float:
+        """Get right coordinate."""
+        return self.bbox[2]
+    
+    @property
+    def y1(self) -> float:
+        """Get bottom coordinate."""
+        return self.bbox[3]
     
     def get_cell(self, row: int, col: int) -> Optional[str]:
         """Get cell content by row and column index."""
-        if 0 <= row < len(self.rows) and 0 <= col < len(self.rows[row]):
+        if row < 0 or col < 0:  # negative indexing would silently work otherwise
+            return None
+        try:
             return self.rows[row][col]
-        return None
+        except IndexError:
+            return None
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert table element to dictionary."""
@@ -156,15 +349,18 @@ class TableElement:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ImageElement:
-    """Represents an image element in a PDF."""
+    """
+    Represents an image element in a PDF.
+    
+    Extractors should prefer writing images to ``image_path`` and leaving
+    ``image_data`` unset; the bytes are then read on demand by
+    ``get_image_data`` instead of being held in memory for every image.
+    """
     
     page_num: int
-    x0: float
-    y0: float
-    x1: float
-    y1: float
+    bbox: Tuple[float, float, float, float]
     image_path: Optional[str] = None
     image_data: Optional[bytes] = None
     image_format: Optional[str] = None
@@ -172,21 +368,55 @@ class ImageElement:
     confidence: float = 1.0
     element_type: ElementType = ElementType.IMAGE
     metadata: Dict[str, Any] = field(default_factory=dict)
+    width: float = field(init=False)
+    height: float = field(init=False)
+    
+    def __post_init__(self) -> None:
+        """Precompute image width and height from the bounding box."""
+        self.width = self.bbox[2] - self.bbox[0]
+        self.height = self.bbox[3] - self.bbox[1]
+    
+    @property
+    def x0(self) -> float:
+        """Get left coordinate."""
+        return self.bbox[0]
     
     @property
-    def bbox(self) -> Tuple[float, float, float, float]:
-        """Get bounding box as tuple (x0, y0, x1, y1)."""
-        return (self.x0, self.y0, self.x1, self.y1)
+    def y0(self) -> float:
+        """Get top coordinate."""
+        return self.bbox[1]
     
     @property
-    def width(self) -> float:
-        """Get image width."""
-        return self.x1 - self.x0
+    def x1(self) -> float:
+        """Get right coordinate."""
+        return self.bbox[2]
     
     @property
-    def height(self) -> float:
-        """Get image height."""
-        return self.y1 - self.y0
+    def y1(self) -> float:
+        """Get bottom coordinate."""
+        return self.bbox[3]
+    
+    def get_image_data(self) -> Optional[bytes]:
+        """
+        Get the image bytes, reading them from ``image_path`` if needed.
+        
+        Bytes read from disk are not retained on the element.
+        
+        Returns:
+            Optional[bytes]: The image bytes, or None if neither in-memory data
+            nor an image path is available.
+        """
+        if self.image_data is not None:
+            return self.image_data
+        if self.image_path:
+            with open(self.image_path, "rb") as f:
+                return f.read()
+        return None
+    
+    def image_view(self) -> Optional[memoryview]:
+        """Get a zero-copy memoryview over the image bytes."""
+        data = self.get_image_data()
+        return memoryview(data) if data is not None else None
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert image element to dictionary."""
@@ -204,7 +434,7 @@ class ImageElement:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PDFPage:
     """Represents a single page in a PDF document."""
     
@@ -217,17 +447,38 @@ class PDFPage:
     image_elements: List[ImageElement] = field(default_factory=list)
     raw_text: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    text_batch: Optional[TextElementBatch] = None
+    
+    @property
+    def num_text_elements(self) -> int:
+        """Get number of text elements, whichever storage holds them."""
+        if self.text_batch is not None:
+            return len(self.text_batch)
+        return len(self.text_elements)
     
     @property
     def all_elements(self) -> List[Any]:
         """Get all elements from the page."""
-        return self.text_elements + self.table_elements + self.image_elements
+        return list(self.iter_all_elements())
+    
+    def iter_text_elements(self) -> Iterator[TextElement]:
+        """Iterate over text elements, whichever storage holds them."""
+        if self.text_batch is not None:
+            return self.text_batch.iter_rows()
+        return iter(self.text_elements)
+    
+    def iter_all_elements(self) -> Iterator[Any]:
+        """Iterate over all elements from the page without copying them."""
+        return chain(self.iter_text_elements(), self.table_elements, self.image_elements)
     
     def get_text(self) -> str:
         """Extract all text from the page."""
         if self.raw_text:
             return self.raw_text
         
+        if self.text_batch is not None:
+            return "\n".join(self.text_batch.texts)
+        
         text_parts = [elem.text for elem in self.text_elements]
         return "\n".join(text_parts)
     
@@ -238,7 +489,7 @@ class PDFPage:
             "width": self.width,
             "height": self.height,
             "rotation": self.rotation,
-            "num_text_elements": len(self.text_elements),
+            "num_text_elements": self.num_text_elements,
             "num_table_elements": len(self.table_elements),
             "num_image_elements": len(self.image_elements),
             "raw_text": self.raw_text,
@@ -246,7 +497,7 @@ class PDFPage:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PDFDocument:
     """Represents a complete PDF document."""
     
@@ -267,40 +518,60 @@ class PDFDocument:
     
     def get_all_text_elements(self) -> List[TextElement]:
         """Get all text elements from all pages."""
-        elements = []
+        elements: List[TextElement] = []
         for page in self.pages:
-            elements.extend(page.text_elements)
+            if page.text_batch is not None:
+                elements.extend(page.text_batch.iter_rows())
+            else:
+                elements.extend(page.text_elements)
         return elements
     
+    def get_all_text_batch(self) -> TextElementBatch:
+        """Get text elements from all pages as a single columnar batch."""
+        return TextElementBatch.concatenate([
+            page.text_batch if page.text_batch is not None
+            else TextElementBatch.from_elements(page.text_elements)
+            for page in self.pages
+        ])
+    
     def get_all_table_elements(self) -> List[TableElement]:
         """Get all table elements from all pages."""
-        elements = []
+        elements: List[TableElement] = []
         for page in self.pages:
             elements.extend(page.table_elements)
         return elements
     
     def get_all_image_elements(self) -> List[ImageElement]:
         """Get all image elements from all pages."""
-        elements = []
+        elements: List[ImageElement] = []
         for page in self.pages:
             elements.extend(page.image_elements)
         return elements
     
     def get_full_text(self) -> str:
         """Extract all text from the entire document."""
-        text_parts = []
-        for page in self.pages:
-            text_parts.append(page.get_text())
-        return "\n\n".join(text_parts)
+        return "\n\n".join([page.get_text() for page in self.pages])
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert document to dictionary."""
+    def to_dict_shallow(self) -> Dict[str, Any]:
+        """Convert document summary (without pages) to dictionary."""
         return {
             "file_path": self.file_path,
             "num_pages": self.num_pages,
             "metadata": self.metadata.to_dict(),
-            "pages": [page.to_dict() for page in self.pages],
         }
+    
+    def to_dict(self, include_pages: bool = True) -> Dict[str, Any]:
+        """
+        Convert document to dictionary.
+        
+        Args:
+            include_pages: Whether to serialize every page. When False this is
+                equivalent to to_dict_shallow().
+        """
+        data = self.to_dict_shallow()
+        if include_pages:
+            data["pages"] = [page.to_dict() for page in self.pages]
+        return data
 
 
 class BasePDFExtractor(ABC):
@@ -327,12 +598,12 @@ class BasePDFExtractor(ABC):
         pass
     
     @abstractmethod
-    def extract_text(self) -> List[TextElement]:
+    def extract_text(self) -> TextElementBatch:
         """
         Extract text elements from PDF.
         
         Returns:
-            List[TextElement]: List of extracted text elements.
+            TextElementBatch: Columnar batch of extracted text elements.
         """
         pass
     
@@ -393,12 +664,12 @@ class SimpleTextExtractor(BasePDFExtractor):
             "SimpleTextExtractor requires PyPDF2 or pdfplumber to be installed and configured."
         )
     
-    def extract_text(self) -> List[TextElement]:
+    def extract_text(self) -> TextElementBatch:
         """
         Extract text elements from PDF.
         
         Returns:
-            List[TextElement]: List of extracted text elements.
+            TextElementBatch: Columnar batch of extracted text elements.
             
         Raises:
             NotImplementedError: This method requires a PDF library implementation.
@@ -478,12 +749,12 @@ class AdvancedPDFExtractor(BasePDFExtractor):
             "AdvancedPDFExtractor requires pdfplumber or similar library to be installed and configured."
         )
     
-    def extract_text(self) -> List[TextElement]:
+    def extract_text(self) -> TextElementBatch:
         """
         Extract text elements from PDF.
         
         Returns:
-            List[TextElement]: List of extracted text elements.
+            TextElementBatch: Columnar batch of extracted text elements.
             
         Raises:
             NotImplementedError: This method requires a PDF library implementation.
@@ -10,14 +10,147 @@ This module provides helper functions for common tasks including:
 
 import logging
 import json
-from typing import Any, Dict, List, Optional, Union
+import mmap
+import os
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Collection, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
+from operator import methodcaller
+import functools
 import hashlib
+import re
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "speedups" extra
+    orjson = None  # type: ignore[assignment,unused-ignore]
+
+try:
+    import xxhash
+except ImportError:  # optional speedup, see the "speedups" extra
+    xxhash = None  # type: ignore[assignment,unused-ignore]
 
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# dataclass(slots=True) requires Python 3.10; older versions get regular classes
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# 19+ digit runs may be integers outside orjson's 64-bit range, which it
+# would silently turn into floats. Digits are mapped to b'0' and all other
+# bytes to b' ' with bytes.translate, so the run check is two C-level passes
+# (a regex search costs several times an orjson parse).
+_DIGITS_TO_ZERO = bytes(0x30 if 0x30 <= c <= 0x39 else 0x20 for c in range(256))
+_LONG_DIGIT_RUN = b'0' * 19
+
+
+def _json_loads(data: bytes) -> Any:
+    """
+    Parse JSON bytes with orjson when installed, else the stdlib parser.
+
+    Input the stdlib accepts but orjson rejects or would alter (NaN/Infinity
+    tokens, integers wider than 64 bits) is parsed with json.loads, so the
+    result always matches json.loads.
+    """
+    if orjson is None or _LONG_DIGIT_RUN in data.translate(_DIGITS_TO_ZERO):
+        return json.loads(data)
+    try:
+        return orjson.loads(data)
+    except ValueError:
+        # orjson.JSONDecodeError; retry for NaN/Infinity, which it rejects
+        return json.loads(data)
+
+
+# Read size used when scanning JSONL files
+_JSONL_CHUNK_SIZE = 256 << 10  # 256 KiB
+
+# load_json suggests iter_load_json for files larger than this
+_LARGE_JSON_BYTES = 64 << 20  # 64 MiB
+
+# Supported hash algorithms (hashlib is backed by OpenSSL, which dispatches
+# to SHA-NI / vectorized implementations where the CPU supports them)
+_HASH_CONSTRUCTORS = {
+    "sha256": hashlib.sha256,
+    "md5": hashlib.md5,
+}
+
+
+def _blake2b_64_hexdigest(data: Union[bytes, bytearray]) -> str:
+    """64-bit BLAKE2b digest as 16 hex digits; stdlib fallback for fast_hash."""
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+# 64-bit digest behind algorithm="fast": XXH3-64 when xxhash is installed,
+# otherwise BLAKE2b truncated to 8 bytes. Both give 16 hex digits.
+_fast_hexdigest = xxhash.xxh3_64_hexdigest if xxhash is not None else _blake2b_64_hexdigest
+
+# Only inputs up to this length are memoized by compute_hash
+_HASH_CACHE_MAX_LEN = 256
+
+# Precompiled patterns for StringOperations
+_CAMEL_SPLIT = re.compile(r'(?<!^)(?=[A-Z])')
+_SNAKE_1 = re.compile(r'(.)([A-Z][a-z]+)')
+_SNAKE_2 = re.compile(r'([a-z0-9])([A-Z])')
+
+# Field accessors for node/edge dictionaries, usable from C-level map()
+_GET_ID = methodcaller("get", "id")
+_GET_SOURCE = methodcaller("get", "source")
+_GET_TARGET = methodcaller("get", "target")
+
+# 64-bit FNV-1a parameters used for non-cryptographic dedupe hashes
+_FNV64_OFFSET = 0xcbf29ce484222325
+_FNV64_PRIME = 0x100000001b3
+
+# Files up to this size are mapped in one piece; larger files in windows
+_MMAP_WHOLE_FILE_LIMIT = 256 << 20  # 256 MiB
+_MMAP_WINDOW = 64 << 20  # 64 MiB, a multiple of mmap.ALLOCATIONGRANULARITY
+
+
+def _read_file_bytes(filepath: Union[str, Path]) -> bytes:
+    """Read a whole file with raw os-level calls, sized by a single fstat."""
+    fd = os.open(filepath, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        if size and hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, size, os.POSIX_FADV_SEQUENTIAL)
+        chunks = []
+        remaining = size
+        while remaining > 0:
+            chunk = os.read(fd, remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        if size == 0:
+            # Special files (e.g. /proc) report size 0; read them to EOF
+            for chunk in iter(lambda: os.read(fd, 4096), b''):
+                chunks.append(chunk)
+        return chunks[0] if len(chunks) == 1 else b''.join(chunks)
+    finally:
+        os.close(fd)
+
+
+def _encode_json(data: Any, indent: int) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes.
+
+    Always uses the stdlib encoder: orjson writes NaN/Infinity as null and
+    formats floats differently, which would alter saved property data.
+    """
+    return json.dumps(data, indent=indent, ensure_ascii=False).encode('utf-8')
+
+
+def _warn_invalid_jsonl(filepath: Union[str, Path], count: int, first_line_num: int) -> None:
+    """Log one aggregated warning for the malformed lines of a JSONL file."""
+    logger.warning("Skipped %d invalid JSON line(s) in %s (first at line %d)",
+                   count, filepath, first_line_num)
+
 
 class DataValidator:
     """Utility class for validating and cleaning data."""
@@ -60,7 +193,11 @@ class DataValidator:
         Returns:
             Sanitized string
         """
-        return text.strip() if isinstance(text, str) else ""
+        try:
+            # The unbound str.strip rejects non-str input (bytes included)
+            return str.strip(text)
+        except TypeError:
+            return ""
 
 
 class FileOperations:
@@ -79,17 +216,75 @@ class FileOperations:
         """
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
+                if (os.fstat(f.fileno()).st_size > _LARGE_JSON_BYTES
+                        and find_spec("ijson") is not None):
+                    logger.warning("Loading large JSON file %s into memory; "
+                                   "consider FileOperations.iter_load_json", filepath)
+                data: Dict[str, Any] = json.load(f)
+                return data
         except FileNotFoundError:
-            logger.warning(f"File not found: {filepath}")
+            logger.warning("File not found: %s", filepath)
             return None
         except json.JSONDecodeError:
-            logger.error(f"Invalid JSON format in file: {filepath}")
+            logger.error("Invalid JSON format in file: %s", filepath)
             return None
         except Exception as e:
-            logger.error(f"Error reading file {filepath}: {str(e)}")
+            logger.error("Error reading file %s: %s", filepath, e)
             return None
 
+    @staticmethod
+    def iter_load_json(filepath: Union[str, Path], prefix: str = "item") -> Iterator[Any]:
+        """
+        Stream the values at a path inside a large JSON document.
+
+        The file is parsed incrementally, so memory use is bounded by the
+        size of one yielded value rather than the whole document. For
+        example, prefix="item" yields the elements of a top-level array and
+        prefix="nodes.item" the elements of a top-level "nodes" array.
+
+        Args:
+            filepath: Path to JSON file
+            prefix: ijson prefix of the values to yield (default: "item")
+
+        Yields:
+            Decoded JSON values found at prefix, in document order
+
+        Raises:
+            ImportError: If ijson is not installed
+        """
+        import ijson
+        with open(filepath, 'rb') as f:
+            yield from ijson.items(f, prefix, use_float=True)
+
+    @staticmethod
+    def load_jsons(filepaths: List[Union[str, Path]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Load JSON data from many small files.
+
+        Each file is read with a bare open/fstat/read/close sequence, with no
+        buffered text wrapper, and parsed directly from bytes.
+
+        Args:
+            filepaths: Paths to JSON files
+
+        Returns:
+            List of parsed JSON data (None for files that failed), in input order
+        """
+        results: List[Optional[Dict[str, Any]]] = []
+        for filepath in filepaths:
+            try:
+                results.append(_json_loads(_read_file_bytes(filepath)))
+            except FileNotFoundError:
+                logger.warning("File not found: %s", filepath)
+                results.append(None)
+            except json.JSONDecodeError:
+                logger.error("Invalid JSON format in file: %s", filepath)
+                results.append(None)
+            except Exception as e:
+                logger.error("Error reading file %s: %s", filepath, e)
+                results.append(None)
+        return results
+
     @staticmethod
     def save_json(data: Dict[str, Any], filepath: Union[str, Path], 
                   indent: int = 2, overwrite: bool = False) -> bool:
@@ -108,19 +303,146 @@ class FileOperations:
         filepath = Path(filepath)
         
         if filepath.exists() and not overwrite:
-            logger.warning(f"File already exists: {filepath}. Set overwrite=True to replace.")
+            logger.warning("File already exists: %s. Set overwrite=True to replace.", filepath)
             return False
 
         try:
             filepath.parent.mkdir(parents=True, exist_ok=True)
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=indent, ensure_ascii=False)
-            logger.info(f"Successfully saved data to {filepath}")
+            payload = _encode_json(data, indent)
+            with open(filepath, 'wb') as f:
+                f.write(payload)
+            logger.info("Successfully saved data to %s", filepath)
             return True
         except Exception as e:
-            logger.error(f"Error saving file {filepath}: {str(e)}")
+            logger.error("Error saving file %s: %s", filepath, e)
             return False
 
+    @staticmethod
+    def save_many_json(items: List[Tuple[Union[str, Path], Dict[str, Any]]],
+                       indent: int = 2, overwrite: bool = False) -> List[bool]:
+        """
+        Save many JSON files, checking for existing files once per directory.
+
+        Instead of one stat per destination, each parent directory is created
+        and listed with a single os.scandir, and existence is checked against
+        that listing. Semantics otherwise match calling save_json per item,
+        including refusing to overwrite a file written earlier in the batch.
+
+        Args:
+            items: (filepath, data) pairs to save
+            indent: JSON indentation level
+            overwrite: Whether to overwrite existing files
+
+        Returns:
+            List of True/False per item (as from save_json), in input order
+        """
+        existing_by_dir: Dict[Path, Set[str]] = {}
+        results: List[bool] = []
+        for filepath, data in items:
+            filepath = Path(filepath)
+            parent = filepath.parent
+            try:
+                existing = existing_by_dir.get(parent)
+                if existing is None:
+                    parent.mkdir(parents=True, exist_ok=True)
+                    with os.scandir(parent) as entries:
+                        existing = {entry.name for entry in entries}
+                    existing_by_dir[parent] = existing
+
+                if filepath.name in existing and not overwrite:
+                    logger.warning("File already exists: %s. Set overwrite=True to replace.",
+                                   filepath)
+                    results.append(False)
+                    continue
+
+                payload = _encode_json(data, indent)
+                with open(filepath, 'wb') as f:
+                    f.write(payload)
+                existing.add(filepath.name)
+                results.append(True)
+            except Exception as e:
+                logger.error("Error saving file %s: %s", filepath, e)
+                results.append(False)
+        logger.info("Successfully saved %d of %d files", sum(results), len(results))
+        return results
+
+    @staticmethod
+    def scan_jsonl_lines(filepath: Union[str, Path], max_line_bytes: int = 16 << 20,
+                         max_bytes: Optional[int] = None) -> Iterator[Tuple[int, bytes]]:
+        """
+        Iterate over the raw lines of a JSONL file without decoding them.
+
+        The file is read in fixed-size chunks and split with bytes.find, so
+        processed bytes are never rescanned and a line spanning several chunks
+        is joined only once, when its newline is found.
+
+        Args:
+            filepath: Path to JSONL file
+            max_line_bytes: Lines longer than this are skipped with a warning
+            max_bytes: Stop after reading this many bytes (default: whole file);
+                a line cut off by the limit is not yielded
+
+        Yields:
+            (line_number, line_bytes) tuples, line numbers starting at 1
+        """
+        pending: List[bytes] = []  # pieces of the current unterminated line
+        pending_size = 0
+        oversized = False
+        line_num = 0
+        bytes_read = 0
+        at_eof = False
+
+        with open(filepath, 'rb') as f:
+            while True:
+                to_read = _JSONL_CHUNK_SIZE
+                if max_bytes is not None:
+                    to_read = min(to_read, max_bytes - bytes_read)
+                    if to_read <= 0:
+                        at_eof = not f.read(1)
+                        break
+                chunk = f.read(to_read)
+                if not chunk:
+                    at_eof = True
+                    break
+                bytes_read += len(chunk)
+
+                start = 0
+                while True:
+                    end = chunk.find(b'\n', start)
+                    if end == -1:
+                        # No newline left in this chunk; keep the tail for later
+                        if not oversized and start < len(chunk):
+                            pending_size += len(chunk) - start
+                            if pending_size > max_line_bytes:
+                                oversized = True
+                                pending = []
+                            else:
+                                pending.append(chunk[start:])
+                        break
+
+                    line_num += 1
+                    if oversized or pending_size + (end - start) > max_line_bytes:
+                        logger.warning("Skipping line %d in %s: longer than %d bytes",
+                                       line_num, filepath, max_line_bytes)
+                    elif pending:
+                        pending.append(chunk[start:end])
+                        yield line_num, b''.join(pending)
+                    else:
+                        yield line_num, chunk[start:end]
+                    pending = []
+                    pending_size = 0
+                    oversized = False
+                    start = end + 1
+
+        # Final line without a trailing newline
+        if at_eof and (pending or oversized):
+            line_num += 1
+            if oversized:
+                logger.warning("Skipping line %d in %s: longer than %d bytes",
+                               line_num, filepath, max_line_bytes)
+            else:
+                yield line_num, b''.join(pending)
+
     @staticmethod
     def load_jsonl(filepath: Union[str, Path]) -> List[Dict[str, Any]]:
         """
@@ -134,19 +456,68 @@ class FileOperations:
         """
         data = []
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    if line.strip():
-                        try:
-                            data.append(json.loads(line))
-                        except json.JSONDecodeError:
-                            logger.warning(f"Invalid JSON at line {line_num} in {filepath}")
+            # Malformed lines are counted and reported once, not per line
+            num_invalid = 0
+            first_invalid = 0
+            for line_num, line in FileOperations.scan_jsonl_lines(filepath):
+                if line.strip():
+                    try:
+                        data.append(_json_loads(line))
+                    except ValueError:
+                        if not num_invalid:
+                            first_invalid = line_num
+                        num_invalid += 1
+            if num_invalid:
+                _warn_invalid_jsonl(filepath, num_invalid, first_invalid)
             return data
         except Exception as e:
-            logger.error(f"Error reading JSONL file {filepath}: {str(e)}")
+            logger.error("Error reading JSONL file %s: %s", filepath, e)
             return []
 
 
+@dataclass(**_SLOTS)
+class Node:
+    """
+    A knowledge graph node.
+
+    Slotted counterpart of the dictionaries returned by
+    GraphOperations.create_node, for graphs too large to hold one dict per
+    entity.
+    """
+
+    id: str
+    type: str
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dictionary form produced by GraphOperations.create_node."""
+        return {"id": self.id, "type": self.type, "attributes": self.attributes}
+
+
+@dataclass(**_SLOTS)
+class Edge:
+    """
+    A knowledge graph edge.
+
+    Slotted counterpart of the dictionaries returned by
+    GraphOperations.create_edge.
+    """
+
+    source: str
+    target: str
+    relation: str
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dictionary form produced by GraphOperations.create_edge."""
+        return {
+            "source": self.source,
+            "target": self.target,
+            "relation": self.relation,
+            "attributes": self.attributes,
+        }
+
+
 class GraphOperations:
     """Utility class for graph-related operations."""
 
@@ -194,58 +565,327 @@ class GraphOperations:
         return edge
 
     @staticmethod
-    def validate_graph_structure(nodes: List[Dict], edges: List[Dict]) -> bool:
+    def build_node_index(nodes: List[Dict]) -> Dict[str, Dict]:
+        """
+        Index nodes by ID in a single pass.
+
+        The index gives O(1) node lookup for edge enrichment and can be
+        passed to validate_graph_structure to reuse it for membership checks.
+        Later nodes win when IDs repeat.
+
+        Args:
+            nodes: List of node dictionaries
+
+        Returns:
+            Dictionary mapping node ID to node dictionary
+        """
+        return {node["id"]: node for node in nodes}
+
+    @staticmethod
+    def validate_graph_structure(nodes: List[Dict], edges: Iterable[Dict],
+                                 node_index: Optional[Dict[str, Dict]] = None) -> bool:
         """
         Validate the structure of a knowledge graph.
 
         Args:
             nodes: List of node dictionaries
-            edges: List of edge dictionaries
+            edges: Edge dictionaries; any iterable, consumed once
+            node_index: Optional index from build_node_index to check against
 
         Returns:
             True if valid structure, False otherwise
         """
         try:
-            node_ids = {node.get("id") for node in nodes}
-            for edge in edges:
-                source = edge.get("source")
-                target = edge.get("target")
-                if source not in node_ids or target not in node_ids:
-                    logger.warning(f"Edge references non-existent nodes: {source} -> {target}")
-                    return False
-            return True
+            # Both endpoint checks and the dangling-edge report walk the edges
+            if not isinstance(edges, (list, tuple)):
+                edges = list(edges)
+            if node_index is not None:
+                # Reuse the caller's index instead of hashing every node ID again
+                node_ids: Collection[str] = node_index
+                has_node = node_index.__contains__
+                valid = (all(map(has_node, map(_GET_SOURCE, edges)))
+                         and all(map(has_node, map(_GET_TARGET, edges))))
+            else:
+                # Batch membership checks run entirely in C via map + issuperset
+                id_set = set(map(_GET_ID, nodes))
+                node_ids = id_set
+                valid = (id_set.issuperset(map(_GET_SOURCE, edges))
+                         and id_set.issuperset(map(_GET_TARGET, edges)))
+            if valid:
+                return True
+
+            # Invalid graph: count offending edges and log once with the first
+            if logger.isEnabledFor(logging.WARNING):
+                dangling = [
+                    edge for edge in edges
+                    if edge.get("source") not in node_ids or edge.get("target") not in node_ids
+                ]
+                logger.warning("%d edge(s) reference non-existent nodes, first: %s -> %s",
+                               len(dangling), dangling[0].get("source"),
+                               dangling[0].get("target"))
+            return False
         except Exception as e:
-            logger.error(f"Error validating graph structure: {str(e)}")
+            logger.error("Error validating graph structure: %s", e)
             return False
 
 
+class GraphBuilder:
+    """
+    Columnar (struct-of-arrays) builder for knowledge graph nodes and edges.
+
+    Nodes and edges are appended to parallel lists instead of one dictionary
+    each, and can be materialized as pandas DataFrames or a pyarrow Table with
+    the low-cardinality type/relation columns dictionary-encoded.
+    """
+
+    __slots__ = ('node_ids', 'node_types', 'node_attrs', 'src', 'dst', 'rel', 'edge_attrs')
+
+    def __init__(self) -> None:
+        """Initialize an empty graph builder."""
+        self.node_ids: List[str] = []
+        self.node_types: List[str] = []
+        self.node_attrs: List[Dict[str, Any]] = []
+        self.src: List[str] = []
+        self.dst: List[str] = []
+        self.rel: List[str] = []
+        self.edge_attrs: List[Dict[str, Any]] = []
+
+    @property
+    def num_nodes(self) -> int:
+        """Get number of nodes added."""
+        return len(self.node_ids)
+
+    @property
+    def num_edges(self) -> int:
+        """Get number of edges added."""
+        return len(self.src)
+
+    def add_node(self, node_id: str, node_type: str,
+                 attributes: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Add a node to the graph.
+
+        Args:
+            node_id: Unique identifier for the node
+            node_type: Type/category of the node
+            attributes: Additional node attributes
+        """
+        self.node_ids.append(node_id)
+        self.node_types.append(node_type)
+        self.node_attrs.append(attributes or {})
+
+    def add_edge(self, source_id: str, target_id: str, relation_type: str,
+                 attributes: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Add an edge to the graph.
+
+        Args:
+            source_id: Source node identifier
+            target_id: Target node identifier
+            relation_type: Type of relationship
+            attributes: Additional edge attributes
+        """
+        self.src.append(source_id)
+        self.dst.append(target_id)
+        self.rel.append(relation_type)
+        self.edge_attrs.append(attributes or {})
+
+    def validate(self) -> bool:
+        """
+        Check that every edge references existing nodes.
+
+        Returns:
+            True if valid structure, False otherwise
+        """
+        node_ids = set(self.node_ids)
+        return node_ids.issuperset(self.src) and node_ids.issuperset(self.dst)
+
+    def to_dicts(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Materialize nodes and edges in the GraphOperations dictionary format.
+
+        Returns:
+            Tuple of (nodes, edges) lists
+        """
+        nodes = [
+            GraphOperations.create_node(i, t, a)
+            for i, t, a in zip(self.node_ids, self.node_types, self.node_attrs)
+        ]
+        edges = [
+            GraphOperations.create_edge(s, d, r, a)
+            for s, d, r, a in zip(self.src, self.dst, self.rel, self.edge_attrs)
+        ]
+        return nodes, edges
+
+    def to_dataframes(self) -> Tuple[Any, Any]:
+        """
+        Materialize nodes and edges as pandas DataFrames.
+
+        Returns:
+            Tuple of (nodes, edges) DataFrames; ``type`` and ``relation`` are
+            categorical columns
+        """
+        import pandas as pd
+        nodes = pd.DataFrame({
+            "id": self.node_ids,
+            "type": pd.Categorical(self.node_types),
+            "attributes": self.node_attrs,
+        })
+        edges = pd.DataFrame({
+            "source": self.src,
+            "target": self.dst,
+            "relation": pd.Categorical(self.rel),
+            "attributes": self.edge_attrs,
+        })
+        return nodes, edges
+
+    def to_arrow(self) -> Tuple[Any, Any]:
+        """
+        Materialize nodes and edges as pyarrow Tables.
+
+        Attribute dictionaries are not included, since they have no fixed
+        schema.
+
+        Returns:
+            Tuple of (nodes, edges) Tables; ``type`` and ``relation`` are
+            dictionary-encoded
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        import pyarrow as pa
+        nodes = pa.table({
+            "id": pa.array(self.node_ids, type=pa.string()),
+            "type": pa.array(self.node_types, type=pa.string()).dictionary_encode(),
+        })
+        edges = pa.table({
+            "source": pa.array(self.src, type=pa.string()),
+            "target": pa.array(self.dst, type=pa.string()),
+            "relation": pa.array(self.rel, type=pa.string()).dictionary_encode(),
+        })
+        return nodes, edges
+
+
 class HashOperations:
     """Utility class for hashing operations."""
 
     @staticmethod
-    def compute_hash(data: str, algorithm: str = "sha256") -> str:
+    def compute_hash(data: Union[str, bytes, bytearray], algorithm: str = "sha256") -> str:
         """
-        Compute hash of a string.
+        Compute hash of a string or bytes.
+
+        Results for short inputs (up to 256 characters or bytes, e.g. node
+        IDs) are memoized (LRU, 131072 entries), so re-hashing the same IDs
+        is a dictionary lookup; longer inputs are hashed directly so the
+        cache never pins large documents. Strings are UTF-8 encoded; bytes
+        are hashed as-is, so callers can encode identifiers once up front.
+        bytearray input is unhashable and bypasses the cache.
 
         Args:
-            data: String to hash
-            algorithm: Hash algorithm (default: sha256)
+            data: String or bytes to hash
+            algorithm: Hash algorithm (default: sha256; "fast" for fast_hash)
 
         Returns:
             Hexadecimal hash string
         """
-        if algorithm == "sha256":
-            return hashlib.sha256(data.encode()).hexdigest()
-        elif algorithm == "md5":
-            return hashlib.md5(data.encode()).hexdigest()
-        else:
+        if len(data) <= _HASH_CACHE_MAX_LEN and not isinstance(data, bytearray):
+            return _cached_hash(data, algorithm)
+        return _hexdigest(data.encode() if isinstance(data, str) else data, algorithm)
+
+    @staticmethod
+    def fast_hash(data: Union[str, bytes, bytearray]) -> str:
+        """
+        Compute a fast non-cryptographic hash of a string.
+
+        Intended for set keys and deduplication where collision resistance
+        against adversarial input is not needed. Uses XXH3-64 when xxhash is
+        installed, otherwise 64-bit BLAKE2b. Both are 64-bit (16 hex digits)
+        but produce different values, so do not persist these across
+        environments.
+
+        Args:
+            data: String or bytes to hash
+
+        Returns:
+            Hexadecimal hash string
+        """
+        if isinstance(data, str):
+            data = data.encode()
+        return _fast_hexdigest(data)
+
+    @staticmethod
+    def compute_hashes(data: List[Union[str, bytes, bytearray]],
+                       algorithm: str = "sha256") -> List[str]:
+        """
+        Compute hashes of many strings or bytes in one call.
+
+        The hash constructor is resolved once for the whole batch, which
+        avoids per-item dispatch when hashing large numbers of node IDs.
+        As in compute_hash, strings are UTF-8 encoded and bytes are hashed
+        as-is.
+
+        Args:
+            data: Strings or bytes to hash
+            algorithm: Hash algorithm (default: sha256; "fast" for fast_hash)
+
+        Returns:
+            List of hexadecimal hash strings, in input order
+        """
+        if algorithm == "fast":
+            return [
+                _fast_hexdigest(item.encode() if isinstance(item, str) else item)
+                for item in data
+            ]
+        constructor = _HASH_CONSTRUCTORS.get(algorithm)
+        if constructor is None:
             raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+        return [
+            constructor(item.encode() if isinstance(item, str) else item).hexdigest()
+            for item in data
+        ]
+
+    @staticmethod
+    def fast_dedupe_hashes(strings: List[str]) -> np.ndarray:
+        """
+        Compute 64-bit FNV-1a hashes of many strings for deduplication.
+
+        Non-cryptographic; intended for set keys and graph-key dedupe. Uses a
+        parallel numba kernel when numba is installed, otherwise a vectorized
+        NumPy implementation. Both produce identical hashes.
+
+        Args:
+            strings: Strings to hash (UTF-8 encoded)
+
+        Returns:
+            uint64 array of hashes, in input order
+        """
+        encoded = [text.encode('utf-8') for text in strings]
+        n = len(encoded)
+        out = np.empty(n, dtype=np.uint64)
+        if n == 0:
+            return out
+
+        lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=n)
+        offsets = np.zeros(n, dtype=np.int64)
+        np.cumsum(lengths[:-1], out=offsets[1:])
+        flat = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+
+        kernel = _get_fnv1a_kernel()
+        if kernel is not None:
+            kernel(flat, offsets, lengths, out)
+        else:
+            _fnv1a_numpy(flat, offsets, lengths, out)
+        return out
 
     @staticmethod
     def compute_file_hash(filepath: Union[str, Path], algorithm: str = "sha256") -> Optional[str]:
         """
         Compute hash of a file.
 
+        Regular files are memory-mapped and handed to the hash in large
+        windows, so the digest runs over contiguous buffers instead of a
+        Python loop of small reads.
+
         Args:
             filepath: Path to file
             algorithm: Hash algorithm (default: sha256)
@@ -254,21 +894,108 @@ class HashOperations:
             Hexadecimal hash string or None if error occurs
         """
         try:
-            if algorithm == "sha256":
-                hash_obj = hashlib.sha256()
-            elif algorithm == "md5":
-                hash_obj = hashlib.md5()
-            else:
+            constructor = _HASH_CONSTRUCTORS.get(algorithm)
+            if constructor is None:
                 raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+            hash_obj = constructor()
 
             with open(filepath, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b''):
-                    hash_obj.update(chunk)
+                size = os.fstat(f.fileno()).st_size
+                if size == 0:
+                    # Empty or special files (e.g. /proc) cannot be mapped
+                    for chunk in iter(lambda: f.read(4096), b''):
+                        hash_obj.update(chunk)
+                    return hash_obj.hexdigest()
+
+                # Map small files whole; bound RSS for large ones with fixed windows
+                window = size if size <= _MMAP_WHOLE_FILE_LIMIT else _MMAP_WINDOW
+                for offset in range(0, size, window):
+                    length = min(window, size - offset)
+                    with mmap.mmap(f.fileno(), length, offset=offset,
+                                   access=mmap.ACCESS_READ) as mm:
+                        if hasattr(mmap, "MADV_SEQUENTIAL"):
+                            mm.madvise(mmap.MADV_SEQUENTIAL)
+                        hash_obj.update(mm)
             return hash_obj.hexdigest()
         except Exception as e:
-            logger.error(f"Error computing file hash for {filepath}: {str(e)}")
+            logger.error("Error computing file hash for %s: %s", filepath, e)
             return None
 
+    @staticmethod
+    def compute_file_hashes(filepaths: List[Union[str, Path]], algorithm: str = "sha256",
+                            max_workers: Optional[int] = None) -> List[Optional[str]]:
+        """
+        Compute hashes of many files concurrently.
+
+        hashlib releases the GIL while digesting large buffers, so a thread
+        pool keeps several files' reads and hashing in flight at once.
+
+        Args:
+            filepaths: Paths to files
+            algorithm: Hash algorithm (default: sha256)
+            max_workers: Number of worker threads (default: min(32, cpu_count + 4))
+
+        Returns:
+            List of hexadecimal hash strings (None for files that failed), in input order
+        """
+        if len(filepaths) <= 1:
+            return [HashOperations.compute_file_hash(p, algorithm) for p in filepaths]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(
+                lambda p: HashOperations.compute_file_hash(p, algorithm), filepaths
+            ))
+
+
+def _hexdigest(buf: Union[bytes, bytearray], algorithm: str) -> str:
+    """Digest of already-encoded bytes with the named algorithm."""
+    if algorithm == "fast":
+        return _fast_hexdigest(buf)
+    constructor = _HASH_CONSTRUCTORS.get(algorithm)
+    if constructor is None:
+        raise ValueError(f"Unsupported hash algorithm: {algorithm}")
+    return constructor(buf).hexdigest()
+
+
+@functools.lru_cache(maxsize=1 << 17)
+def _cached_hash(data: Union[str, bytes], algorithm: str) -> str:
+    """Memoized digest of a string or bytes; repeated node IDs skip the hash entirely."""
+    return _hexdigest(data if isinstance(data, bytes) else data.encode(), algorithm)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_fnv1a_kernel() -> Optional[Any]:
+    """Compile the numba FNV-1a kernel on first use, or None if numba is absent."""
+    if find_spec("numba") is None:
+        return None
+    import numba
+
+    @numba.njit(parallel=True, cache=True)
+    def _fnv1a(flat, offsets, lengths, out):
+        for i in numba.prange(offsets.shape[0]):
+            h = np.uint64(_FNV64_OFFSET)
+            for j in range(offsets[i], offsets[i] + lengths[i]):
+                h = (h ^ np.uint64(flat[j])) * np.uint64(_FNV64_PRIME)
+            out[i] = h
+
+    return _fnv1a
+
+
+def _fnv1a_numpy(flat: np.ndarray, offsets: np.ndarray, lengths: np.ndarray,
+                 out: np.ndarray) -> None:
+    """Column-wise FNV-1a over all strings at once, longest strings first."""
+    order = np.argsort(-lengths, kind="stable")
+    sorted_lengths = lengths[order]
+    starts = offsets[order]
+    h = np.full(len(order), _FNV64_OFFSET, dtype=np.uint64)
+    prime = np.uint64(_FNV64_PRIME)
+    # Strings longer than j form a prefix of the sorted order; count them per j
+    max_length = int(sorted_lengths[0]) if len(order) else 0
+    active_counts = np.searchsorted(-sorted_lengths, -np.arange(max_length), side="left")
+    for j, active in enumerate(active_counts):
+        h[:active] ^= flat[starts[:active] + j].astype(np.uint64)
+        h[:active] *= prime
+    out[order] = h
+
 
 class StringOperations:
     """Utility class for string operations."""
@@ -284,8 +1011,7 @@ class StringOperations:
         Returns:
             Space-separated string
         """
-        import re
-        return re.sub(r'(?<!^)(?=[A-Z])', ' ', text)
+        return _CAMEL_SPLIT.sub(' ', text)
 
     @staticmethod
     def to_snake_case(text: str) -> str:
@@ -298,9 +1024,8 @@ class StringOperations:
         Returns:
             snake_case string
         """
-        import re
-        text = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', text)
-        return re.sub('([a-z0-9])([A-Z])', r'\1_\2', text).lower()
+        text = _SNAKE_1.sub(r'\1_\2', text)
+        return _SNAKE_2.sub(r'\1_\2', text).lower()
 
     @staticmethod
     def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
@@ -317,7 +1042,8 @@ class StringOperations:
         """
         if len(text) <= max_length:
             return text
-        return text[:max_length - len(suffix)] + suffix
+        cutoff = max_length - len(suffix)
+        return text[:cutoff] + suffix
 
 
 def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
@@ -349,6 +1075,9 @@ __all__ = [
     'DataValidator',
     'FileOperations',
     'GraphOperations',
+    'GraphBuilder',
+    'Node',
+    'Edge',
     'HashOperations',
     'StringOperations',
     'setup_logger',
@@ -0,0 +1,98 @@
+"""Tests for configuration file loading and hot reload."""
+
+import os
+import time
+
+import pytest
+
+from polymer_knowledge_graph import config as config_module
+from polymer_knowledge_graph.config import Config, reload_config
+
+
+@pytest.fixture(autouse=True)
+def restore_global_config():
+    """Keep reloads in one test from leaking into the next."""
+    previous = config_module._config
+    yield
+    config_module._config = previous
+
+
+def write_yaml(path, text):
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_load_file_applies_and_coerces_overrides(tmp_path):
+    path = write_yaml(tmp_path / "config.yaml", "api:\n  port: '9000'\n  debug: 'yes'\n")
+    config = Config()
+    config.load_file(path)
+    assert config.api.port == 9000
+    assert config.api.debug is True
+    assert config.config_files == [path]
+
+
+def test_load_file_rolls_back_on_bad_value(tmp_path):
+    path = write_yaml(
+        tmp_path / "config.yaml",
+        "database:\n  host: db.example.org\napi:\n  port: not-a-number\n",
+    )
+    config = Config()
+    database, api = config.database, config.api
+    with pytest.raises(ValueError, match="api.port"):
+        config.load_file(path)
+    assert config.database is database
+    assert config.api is api
+    assert config.config_files == []
+
+
+def test_load_file_rolls_back_on_failed_validation(tmp_path):
+    path = write_yaml(tmp_path / "config.yaml", "api:\n  port: 70000\n")
+    config = Config()
+    api = config.api
+    with pytest.raises(ValueError, match="validation failed"):
+        config.load_file(path)
+    assert config.api is api
+
+
+def test_load_file_skips_secrets(tmp_path):
+    path = write_yaml(
+        tmp_path / "config.yaml",
+        "database:\n  password: from-file\n  pool_size: 3\n"
+        "security:\n  secret_key: from-file-secret\n",
+    )
+    config = Config()
+    password, secret_key = config.database.password, config.security.secret_key
+    config.load_file(path)
+    assert config.database.password == password
+    assert config.security.secret_key == secret_key
+    assert config.database.pool_size == 3
+
+
+def test_load_file_rejects_non_mapping(tmp_path):
+    path = write_yaml(tmp_path / "config.yaml", "- just\n- a list\n")
+    with pytest.raises(ValueError, match="mapping"):
+        Config().load_file(path)
+
+
+def test_reload_config_reads_fresh_environment(monkeypatch):
+    monkeypatch.setenv("API_WORKERS", "7")
+    assert reload_config([]).api.workers == 7
+    monkeypatch.setenv("API_WORKERS", "9")
+    assert reload_config([]).api.workers == 9
+    assert config_module.get_config().api.workers == 9
+
+
+def test_watch_reloads_on_mtime_change(tmp_path):
+    path = write_yaml(tmp_path / "config.yaml", "cache:\n  ttl: 10\n")
+    reload_config([path])
+    stop = Config().watch([path], interval=0.01)
+    try:
+        write_yaml(tmp_path / "config.yaml", "cache:\n  ttl: 20\n")
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        deadline = time.monotonic() + 5.0
+        while config_module.get_config().cache.ttl != 20 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        stop.set()
+    assert config_module.get_config().cache.ttl == 20
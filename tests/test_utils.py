@@ -0,0 +1,62 @@
+"""Tests for JSONL scanning in FileOperations."""
+
+import pytest
+
+from polymer_knowledge_graph import utils
+from polymer_knowledge_graph.utils import FileOperations
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    """Read JSONL files a few bytes at a time so lines span chunks."""
+    monkeypatch.setattr(utils, "_JSONL_CHUNK_SIZE", 4)
+
+
+def write_jsonl(tmp_path, data):
+    path = tmp_path / "data.jsonl"
+    path.write_bytes(data)
+    return path
+
+
+def scan(path, **kwargs):
+    return list(FileOperations.scan_jsonl_lines(path, **kwargs))
+
+
+def test_scan_yields_numbered_lines(tmp_path):
+    path = write_jsonl(tmp_path, b'{"a": 1}\n\n{"b": 2}\n')
+    assert scan(path) == [(1, b'{"a": 1}'), (2, b''), (3, b'{"b": 2}')]
+
+
+def test_scan_joins_lines_spanning_chunks(tmp_path, small_chunks):
+    path = write_jsonl(tmp_path, b'{"key": "value"}\n{"k": 1}\nxy\n')
+    assert scan(path) == [(1, b'{"key": "value"}'), (2, b'{"k": 1}'), (3, b'xy')]
+
+
+def test_scan_yields_final_line_without_newline(tmp_path, small_chunks):
+    path = write_jsonl(tmp_path, b'{"a": 1}\n{"last": true}')
+    assert scan(path) == [(1, b'{"a": 1}'), (2, b'{"last": true}')]
+
+
+@pytest.mark.parametrize("chunk_size", [4, 1 << 10])
+def test_scan_skips_lines_over_max_line_bytes(tmp_path, monkeypatch, chunk_size):
+    monkeypatch.setattr(utils, "_JSONL_CHUNK_SIZE", chunk_size)
+    path = write_jsonl(tmp_path, b'"ok"\n"' + b'x' * 20 + b'"\n"ok2"\n"' + b'y' * 20 + b'"')
+    assert scan(path, max_line_bytes=10) == [(1, b'"ok"'), (3, b'"ok2"')]
+
+
+def test_scan_stops_at_max_bytes(tmp_path, small_chunks):
+    path = write_jsonl(tmp_path, b'"one"\n"two"\n"three"\n')
+    # 9 bytes covers the first line and part of the second, which is dropped
+    assert scan(path, max_bytes=9) == [(1, b'"one"')]
+    assert scan(path, max_bytes=12) == [(1, b'"one"'), (2, b'"two"')]
+
+
+def test_scan_max_bytes_covering_whole_file_keeps_final_line(tmp_path):
+    data = b'"one"\n"two"'
+    path = write_jsonl(tmp_path, data)
+    assert scan(path, max_bytes=len(data)) == [(1, b'"one"'), (2, b'"two"')]
+
+
+def test_load_jsonl_skips_invalid_lines(tmp_path, small_chunks):
+    path = write_jsonl(tmp_path, b'{"a": 1}\nnot json\n\n{"b": 2}')
+    assert FileOperations.load_jsonl(path) == [{"a": 1}, {"b": 2}]